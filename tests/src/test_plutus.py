@@ -2,10 +2,15 @@ import configparser
 import contextlib
 import importlib.util
 import io
+import json
 import os
+import shutil
+import socket
 import sys
+import time
 import unittest
 from subprocess import PIPE, Popen
+from unittest import mock
 
 PLUTUS = None
 SCRIPT_PATH = "src/plutus"
@@ -13,6 +18,16 @@ SCRIPT_PATH = "src/plutus"
 TEST_CONFIG = "/tmp/plutus.ini"
 TEST_PROFILE = "/tmp/plutus.csv"
 TEST_CONFIG_INFO_TEMPLATE = "/tmp/info_template.txt"
+TEST_PROFILE_CACHE = "/tmp/.plutus.csv.cache"
+TEST_PROFILE_LINT_CACHE = "/tmp/.plutus.csv.lint"
+TEST_PROFILE_INDEX = "/tmp/.plutus.csv.index"
+TEST_PROFILE_SOCKET = "/tmp/.plutus.csv.sock"
+TEST_PROFILE_SHARDS = "/tmp/plutus-shards"
+TEST_PROFILE_JOINED = "/tmp/plutus-joined.csv"
+TEST_PROFILE_LINK = "/tmp/plutus-link.csv"
+TEST_BATCH = "/tmp/plutus-batch.txt"
+TEST_REPORT = "/tmp/plutus-report.ini"
+TEST_BENCHMARK = "/tmp/plutus-benchmark.json"
 
 
 def load_plutus_module():
@@ -75,6 +90,18 @@ def replace_csv_line(line_number, line, extra_lint_flag=None):
     return stdout, stderr, rc
 
 
+def write_multi_line_profile(headers):
+    with open(TEST_PROFILE, "w") as file:
+        file.write(headers)
+        file.write('2025-01-01,"Income:A",1.00,"Zelle","first",""\n')
+        file.write(
+            '2025-01-02,"Income:B",2.00,"Zelle","line one\nline two",""\n'
+        )
+        file.write('2025-01-03,"Income:C",3.00,"Zelle","last",""\n')
+
+    return None
+
+
 def replace_config_line(setting, old_value, new_value, *command):
     with open(TEST_CONFIG) as file:
         lines = file.readlines()
@@ -127,11 +154,22 @@ class TestCLI(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        try:
-            os.remove(TEST_PROFILE)
-            os.remove(TEST_CONFIG)
-        except OSError:
-            pass
+        for path in (
+            TEST_PROFILE,
+            TEST_CONFIG,
+            TEST_PROFILE_CACHE,
+            TEST_PROFILE_LINT_CACHE,
+            TEST_PROFILE_INDEX,
+            TEST_PROFILE_JOINED,
+            TEST_PROFILE_LINK,
+            TEST_BATCH,
+            TEST_REPORT,
+            TEST_BENCHMARK,
+        ):
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+        shutil.rmtree(TEST_PROFILE_SHARDS, ignore_errors=True)
 
     def setUp(self):
         os.environ["LC_ALL"] = "en_US.UTF-8"
@@ -155,23 +193,123 @@ class TestCLI(unittest.TestCase):
 
         categories = ["a", "b"]
 
-        # Without this, the output was always being printed to stdout.
-        with contextlib.redirect_stdout(io.StringIO()):
-            PLUTUS.run_demo_benchmark(10, categories)
+        benchmark_profile_path = PLUTUS.generate_benchmark_profile(
+            10, categories
+        )
 
         items = []
-        benchmark_profile_path = f"{PLUTUS.DEMO_PROFILE}-10"
         with open(benchmark_profile_path) as file:
             for line in file:
                 items.append(line.strip())
 
+        self.assertEqual(f"{PLUTUS.DEMO_PROFILE}-10", benchmark_profile_path)
         self.assertEqual(11, len(items))
         self.assertEqual(items[0], PLUTUS.CSV_HEADERS)
         self.assertEqual(items[1].count(","), 5)
 
+        # The same seed always generates the same items.
+        PLUTUS.generate_benchmark_profile(10, categories)
+
+        with open(benchmark_profile_path) as file:
+            self.assertEqual(items, [line.strip() for line in file])
+
+        PLUTUS.generate_benchmark_profile(10, categories, seed=1)
+
+        with open(benchmark_profile_path) as file:
+            self.assertNotEqual(items, [line.strip() for line in file])
+
         if os.path.exists(benchmark_profile_path):
             os.remove(benchmark_profile_path)
 
+    def test_demo_benchmarks_baseline(self):
+        benchmark_args = ["demo", "-b", "--sizes", "20", "--repeat", "1"]
+
+        stdout, _stderr, rc = call_script(
+            *benchmark_args, "--output", TEST_BENCHMARK
+        )
+
+        with open(TEST_BENCHMARK) as file:
+            benchmark = json.load(file)
+
+        self.assertIn("show --summary", stdout)
+        self.assertEqual(0, rc)
+        self.assertEqual(0, benchmark["seed"])
+        self.assertEqual(
+            {"total", "read", "filter", "aggregate", "render"},
+            set(benchmark["results"]["20"]["show --summary"]),
+        )
+        self.assertEqual(
+            {
+                "total",
+                "read",
+                "parse",
+                "filter",
+                "lint",
+                "sort",
+                "unique",
+                "aggregate",
+            },
+            set(benchmark["results"]["20"]["lint"]),
+        )
+        self.assertEqual(
+            {"total", "sort", "write", "render"},
+            set(benchmark["results"]["20"]["edit --sort"]),
+        )
+        self.assertEqual(
+            {"total", "startup", "read", "parse", "write"},
+            set(benchmark["results"]["20"]["import"]),
+        )
+
+        # Pretend only parsing the import used to be a lot faster.
+        benchmark["results"]["20"]["import"]["parse"] = 0.001
+
+        with open(TEST_BENCHMARK, "w") as file:
+            json.dump(benchmark, file)
+
+        stdout, _stderr, rc = call_script(
+            *benchmark_args, "--baseline", TEST_BENCHMARK
+        )
+
+        self.assertRegex(
+            stdout, r"20 +\| import +\| parse +\| 0\.00ms .* REGRESSION"
+        )
+        self.assertIn("slower than the baseline", stdout)
+        self.assertEqual(1, rc)
+        self.assertFalse(os.path.exists(f"{TEST_PROFILE}-20-unsorted"))
+
+        if os.path.exists(f"{TEST_PROFILE}-20"):
+            os.remove(f"{TEST_PROFILE}-20")
+
+    def test_amount_to_cents(self):
+        PLUTUS = load_plutus_module()
+
+        self.assertEqual(-2001, PLUTUS.amount_to_cents("-20.01"))
+        self.assertEqual(1, PLUTUS.amount_to_cents("0.01"))
+        self.assertEqual(-50, PLUTUS.amount_to_cents("-.50"))
+        self.assertEqual(10000, PLUTUS.amount_to_cents("100"))
+        self.assertEqual(100, PLUTUS.amount_to_cents("1.005"))
+
+        with self.assertRaises(Exception):
+            PLUTUS.amount_to_cents("ZZZ")
+
+        self.assertEqual("-20.01", PLUTUS.format_cents(-2001))
+        self.assertEqual("-0.05", PLUTUS.format_cents(-5))
+        self.assertEqual("1614.00", PLUTUS.format_cents(161400))
+
+    def test_parse_raw_csv_line(self):
+        PLUTUS = load_plutus_module()
+
+        self.assertEqual(["a", "b", ""], PLUTUS.parse_raw_csv_line("a,b,"))
+        self.assertEqual(
+            ['"a,b"', "-1.00", '"c"'],
+            PLUTUS.parse_raw_csv_line('"a,b",-1.00,"c"'),
+        )
+        self.assertEqual(
+            ['"say "hi""', '""', "x"],
+            PLUTUS.parse_raw_csv_line('"say ""hi""","",x'),
+        )
+        self.assertEqual(['"a,b'], PLUTUS.parse_raw_csv_line('"a,b'))
+
     def test_demo_init_flags_are_mutually_exclusive(self):
         _stdout, _stderr, rc = call_script("demo")
 
@@ -385,6 +523,7 @@ class TestCLI(unittest.TestCase):
             file.writelines(lines)
 
         stdout, _stderr, rc = call_script("lint")
+        stdout_diff, _stderr, _rc = call_script("lint", "--diff")
 
         # Swap the lines back.
         lines[1] = f"{first_line}\n"
@@ -394,7 +533,10 @@ class TestCLI(unittest.TestCase):
             file.writelines(lines)
 
         self.assertIn("SORT_BY_DATE_MISMATCH", stdout)
-        self.assertIn("@@ -1,4 +1,4 @@", stdout)
+        self.assertIn("L3", stdout)
+        self.assertIn(first_line, stdout)
+        self.assertNotIn("@@", stdout)
+        self.assertIn("@@ -1,4 +1,4 @@", stdout_diff)
         self.assertEqual(1, rc)
 
     def test_lint_invalid_uniqueness(self):
@@ -404,9 +546,12 @@ class TestCLI(unittest.TestCase):
             file.write(f"{duplicate_line}\n")
 
         stdout, _stderr, rc = call_script("lint")
+        stdout_diff, _stderr, _rc = call_script("lint", "--diff")
 
         self.assertIn("UNIQUENESS_MISMATCH", stdout)
-        self.assertIn("@@ -30,4 +30,3 @@", stdout)
+        self.assertIn(f"{duplicate_line}\n", stdout)
+        self.assertNotIn("@@", stdout)
+        self.assertIn("@@ -30,4 +30,3 @@", stdout_diff)
         self.assertEqual(1, rc)
 
         _, _, rc_no_unique_errors = call_script("lint", "--no-unique-errors")
@@ -422,6 +567,357 @@ class TestCLI(unittest.TestCase):
 
         self.assertEqual(0, rc_no_unique_errors)
 
+    def test_lint_cache_mode(self):
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+
+        if os.path.exists(TEST_PROFILE_LINT_CACHE):
+            os.remove(TEST_PROFILE_LINT_CACHE)
+
+        call_script("lint")
+        cache_mode = os.stat(TEST_PROFILE_LINT_CACHE).st_mode & 0o777
+
+        os.chmod(TEST_PROFILE, mode)
+
+        self.assertEqual(0o600, cache_mode)
+
+    def test_lint_cache(self):
+        if os.path.exists(TEST_PROFILE_LINT_CACHE):
+            os.remove(TEST_PROFILE_LINT_CACHE)
+
+        stdout, _stderr, rc = call_script("lint")
+
+        self.assertTrue(os.path.exists(TEST_PROFILE_LINT_CACHE))
+
+        stdout_cached, _stderr, rc_cached = call_script("lint")
+
+        self.assertEqual(stdout, stdout_cached)
+        self.assertEqual(rc, rc_cached)
+
+        # Changed lines get checked while everything else comes from the cache.
+        stdout, _stderr, rc = replace_csv_line(3, '2024-01-12,"A",0.01," ",,')
+
+        self.assertIn("WHITESPACE_MISMATCH", stdout)
+        self.assertIn("L4", stdout)
+        self.assertEqual(1, rc)
+
+        # A problem is reported on its new line when other lines move.
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines[:3] + [' 2024-01-12,"A",0.01,,,\n'])
+
+        stdout, _stderr, _rc = call_script("lint", "--no-unique-errors")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines([lines[0], lines[2], ' 2024-01-12,"A",0.01,,,\n'])
+
+        stdout_moved, _stderr, _rc = call_script("lint", "--no-unique-errors")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn("L4", stdout)
+        self.assertIn("L3", stdout_moved)
+        self.assertNotIn("L4", stdout_moved)
+
+    def test_insert_profile_item(self):
+        PLUTUS = load_plutus_module()
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        middle_item = '2025-01-01,"Income:Merch",1.00,"Checking",,'
+        last_item = '2026-01-01,"Income:Merch",1.00,"Checking",,'
+
+        PLUTUS.insert_profile_items(TEST_PROFILE, [last_item, middle_item])
+
+        with open(TEST_PROFILE) as file:
+            inserted_lines = file.readlines()
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        expected_lines = [f"{middle_item}\n", f"{last_item}\n"]
+        expected_lines = lines[:1] + sorted(lines[1:] + expected_lines)
+
+        self.assertEqual(expected_lines, inserted_lines)
+
+    def test_insert_items_multi_line_profile(self):
+        PLUTUS = load_plutus_module()
+        PLUTUS.PLUTUS_PROFILE = TEST_PROFILE
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        write_multi_line_profile(lines[0])
+
+        # This sorts between the 2 lines of the multi-line description.
+        new_item = '2025-01-02,"Income:C",1.00,"Zelle",,'
+        PLUTUS.insert_items([new_item])
+
+        with open(TEST_PROFILE) as file:
+            inserted = file.read()
+
+        stdout, _stderr, rc = call_script("show")
+        _stdout, _stderr, rc_lint = call_script("lint")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn(f'line two",""\n{new_item}\n', inserted)
+        self.assertNotIn("PARSE_FAILURE", stdout)
+        self.assertEqual(0, rc)
+        self.assertEqual(0, rc_lint)
+
+    def test_insert_profile_item_keeps_symlink_and_mode(self):
+        PLUTUS = load_plutus_module()
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+        os.symlink(TEST_PROFILE, TEST_PROFILE_LINK)
+
+        middle_item = '2025-01-01,"Income:Merch",1.00,"Checking",,'
+        PLUTUS.insert_profile_items(TEST_PROFILE_LINK, [middle_item])
+
+        is_link = os.path.islink(TEST_PROFILE_LINK)
+        inserted_mode = os.stat(TEST_PROFILE).st_mode & 0o777
+
+        os.remove(TEST_PROFILE_LINK)
+        os.chmod(TEST_PROFILE, mode)
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertTrue(is_link)
+        self.assertEqual(0o600, inserted_mode)
+
+    def test_insert_batch(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_BATCH, "w") as file:
+            file.write("2026-01-01,Income:Merch,1500,Checking,,\n")
+            file.write(
+                '{"date": "2025-01-01", "category": "Income:Merch", "amount": 1.5, "method": "Checking", "notes": "a \\"b\\""}\n'  # noqa: E501
+            )
+
+        stdout, _stderr, rc = call_script("insert", "--batch", TEST_BATCH)
+
+        with open(TEST_PROFILE) as file:
+            inserted_lines = file.readlines()
+
+        _stdout_lint, _stderr, rc_lint = call_script("lint")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        expected_lines = [
+            '2026-01-01,"Income:Merch",1500.00,"Checking",,\n',
+            '2025-01-01,"Income:Merch",1.50,"Checking",,"a ""b"""\n',
+        ]
+        expected_lines = lines[:1] + sorted(lines[1:] + expected_lines)
+
+        self.assertIn("2 items were inserted", stdout)
+        self.assertEqual(0, rc)
+        self.assertEqual(expected_lines, inserted_lines)
+        self.assertEqual(0, rc_lint)
+
+    def test_insert_batch_multi_line_profile(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        write_multi_line_profile(lines[0])
+
+        with open(TEST_BATCH, "w") as file:
+            file.write("2025-01-02,Income:C,1.00,Zelle,,\n")
+
+        stdout, _stderr, rc = call_script("insert", "--batch", TEST_BATCH)
+
+        with open(TEST_PROFILE) as file:
+            inserted = file.read()
+
+        stdout_show, _stderr, rc_show = call_script("show")
+        _stdout, _stderr, rc_lint = call_script("lint")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn("1 item was inserted", stdout)
+        self.assertEqual(0, rc)
+        self.assertIn('line two",""\n2025-01-02,"Income:C"', inserted)
+        self.assertNotIn("PARSE_FAILURE", stdout_show)
+        self.assertEqual(0, rc_show)
+        self.assertEqual(0, rc_lint)
+
+    def test_insert_batch_multi_line_item(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        # The 1st batch adds a multi-line item to a profile without any, the
+        # 2nd batch must keep it whole.
+        with open(TEST_BATCH, "w") as file:
+            file.write(
+                '{"date": "2025-01-03", "category": "Income:D", "amount": 1, "method": "Zelle", "description": "a\\nb"}\n'  # noqa: E501
+            )
+
+        call_script("insert", "--batch", TEST_BATCH)
+
+        with open(TEST_BATCH, "w") as file:
+            file.write("2025-01-03,Income:E,1.00,Zelle,,\n")
+
+        stdout, _stderr, rc = call_script("insert", "--batch", TEST_BATCH)
+
+        with open(TEST_PROFILE) as file:
+            inserted = file.read()
+
+        _stdout, _stderr, rc_lint = call_script("lint")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn("1 item was inserted", stdout)
+        self.assertEqual(0, rc)
+        self.assertIn('"a\nb",\n2025-01-03,"Income:E"', inserted)
+        self.assertEqual(0, rc_lint)
+
+    def test_insert_index_mode(self):
+        PLUTUS = load_plutus_module()
+
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+
+        PLUTUS.build_profile_index(TEST_PROFILE)
+        index_mode = os.stat(TEST_PROFILE_INDEX).st_mode & 0o777
+
+        os.chmod(TEST_PROFILE, mode)
+
+        self.assertEqual(0o600, index_mode)
+
+    def test_insert_index(self):
+        PLUTUS = load_plutus_module()
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        index = PLUTUS.build_profile_index(TEST_PROFILE)
+
+        self.assertTrue(os.path.exists(TEST_PROFILE_INDEX))
+        self.assertEqual(index, PLUTUS.load_profile_index(TEST_PROFILE))
+        self.assertEqual(
+            (3, "2025-12-30"), index["categories"]["Income:Affiliates:Amazon"]
+        )
+        self.assertEqual(
+            "Income:Consulting",
+            PLUTUS.order_index_values(index["categories"], "count")[0],
+        )
+
+        with open(TEST_BATCH, "w") as file:
+            file.write("2026-01-01,Income:Affiliates:Amazon,1.00,Zelle,,\n")
+
+        call_script("insert", "--batch", TEST_BATCH)
+
+        # Inserting keeps the index up to date without rebuilding it.
+        index = PLUTUS.load_profile_index(TEST_PROFILE)
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertEqual(
+            (4, "2026-01-01"), index["categories"]["Income:Affiliates:Amazon"]
+        )
+        self.assertEqual((1, "2026-01-01"), index["methods"]["Zelle"])
+        self.assertIn(
+            ("2026-01-01", "Income:Affiliates:Amazon", 100, "Zelle", "", ""),
+            index["latest"]["Income:Affiliates:Amazon"],
+        )
+        self.assertIsNone(PLUTUS.load_profile_index(TEST_PROFILE))
+
+    def test_insert_batch_invalid(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_BATCH, "w") as file:
+            file.write("2026-01-01,Income:Merch,1500,Checking,,\n")
+            file.write("2026-01-01,Income::Merch,1500,Checking,,\n")
+            file.write('{"date": "2026-01-01"}\n')
+
+        stdout, _stderr, rc = call_script("insert", "--batch", TEST_BATCH)
+
+        with open(TEST_PROFILE) as file:
+            inserted_lines = file.readlines()
+
+        self.assertIn("CATEGORY_MISMATCH", stdout)
+        self.assertIn("L2", stdout)
+        self.assertIn("METHOD_MISMATCH", stdout)
+        self.assertIn("L3", stdout)
+        self.assertIn("nothing was inserted", stdout)
+        self.assertEqual(1, rc)
+        self.assertEqual(lines, inserted_lines)
+
+    def test_serve(self):
+        local_stdout, _stderr, _rc = call_script("show", "--summary")
+
+        # The socket should only be usable by you even with a loose umask.
+        old_umask = os.umask(0)
+        server = Popen([SCRIPT_PATH, "serve"], stdout=PIPE, text=True)
+        os.umask(old_umask)
+        self.assertIn("Serving", server.stdout.readline())
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        try:
+            self.assertTrue(os.path.exists(TEST_PROFILE_SOCKET))
+            self.assertEqual(
+                0o600, os.stat(TEST_PROFILE_SOCKET).st_mode & 0o777
+            )
+
+            stdout, _stderr, rc = call_script("show", "--summary")
+            self.assertEqual(local_stdout, stdout)
+            self.assertEqual(0, rc)
+
+            stdout, _stderr, rc = call_script("serve")
+            self.assertIn("SERVER_ALREADY_RUNNING", stdout)
+            self.assertEqual(1, rc)
+
+            _stdout, stderr, rc = call_script("show", "--sort", "nope")
+            self.assertIn("'nope' must be", stderr)
+            self.assertEqual(2, rc)
+
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(TEST_PROFILE_SOCKET)
+                client.sendall(b'{"argv": ["config"]}\n')
+
+                with client.makefile("rb") as reader:
+                    response = json.loads(reader.readline())
+                    stdout = reader.read().decode()
+
+            self.assertIn("COMMAND_NOT_ALLOWED", stdout)
+            self.assertEqual(1, response["status"])
+
+            # Make sure the mtime changes so the edit isn't missed.
+            time.sleep(0.01)
+
+            with open(TEST_PROFILE, "a") as file:
+                file.write("2026-01-01,Income:Merch,12345.67,Checking,,\n")
+
+            stdout, _stderr, _rc = call_script("show", "Merch", "--tail", "1")
+            self.assertIn("12,345.67", stdout)
+        finally:
+            with open(TEST_PROFILE, "w") as file:
+                file.writelines(lines)
+
+            server.terminate()
+            server.communicate()
+
+        self.assertEqual(0, server.returncode)
+        self.assertFalse(os.path.exists(TEST_PROFILE_SOCKET))
+
     def test_info_help(self):
         stdout, _stderr, _rc = call_script("info", "--help")
         self.assertIn("View examples, tips and templates", stdout)
@@ -521,6 +1017,129 @@ class TestCLI(unittest.TestCase):
         self.assertIn("Checking", lines[-1])
         self.assertIn("-$454.21", lines[-1])
 
+    def test_show_limit(self):
+        stdout, _stderr, _rc = call_script("show", "--limit", "2")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[3].startswith("1 "))
+        self.assertTrue(lines[-1].startswith("2 "))
+
+    def test_show_tail(self):
+        stdout, _stderr, _rc = call_script("show", "--tail", "2")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[3].startswith("31 "))
+        self.assertIn("2025-12-30", lines[-1])
+        self.assertIn("-$454.21", lines[-1])
+
+    def test_show_multiline_description(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        write_multi_line_profile(lines[0])
+
+        stdout, _stderr, _rc = call_script("show")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        # The description's newline is printed as is, the rows stay aligned.
+        rows = stdout.splitlines()[3:]
+
+        self.assertEqual(4, len(rows))
+        self.assertIn("Income:B", rows[1])
+        self.assertIn("line one", rows[1])
+        self.assertTrue(rows[2].startswith("line two"))
+        self.assertIn("Income:C", rows[3])
+        self.assertIn("last", rows[3])
+
+    def test_show_format(self):
+        stdout, _stderr, _rc = call_script("show", "--tail", "2", "-f", "csv")
+
+        self.assertEqual(
+            """date,category,amount,method,description,notes
+2025-11-30,Income:Affiliates:DigitalOcean,50.00,PayPal,27T60611H28616305,do@example.com
+2025-12-30,Income:Affiliates:Amazon,234.56,Checking,"AMAZON.COM, INC. PAYMENTS",
+""",  # noqa: E501
+            stdout,
+        )
+
+        stdout, _stderr, _rc = call_script(
+            "show", "-m", "--tail", "1", "-f", "ndjson"
+        )
+
+        self.assertEqual(
+            '{"category": "Tax:Refunds", "total": 1850.00, "items": 2, "min": 236.00, "max": 1614.00, "average": 925.00}\n',  # noqa: E501
+            stdout,
+        )
+
+        stdout, _stderr, _rc = call_script("show", "-f", "json")
+        items = json.loads(stdout)
+
+        self.assertEqual(32, len(items))
+        self.assertEqual(234.56, items[-1]["amount"])
+        self.assertEqual("", items[-1]["notes"])
+
+        stdout, _stderr, _rc = call_script("show", "nope", "-f", "json")
+        self.assertEqual([], json.loads(stdout))
+
+        stdout, _stderr, rc = call_script("show", "--raw", "-f", "json")
+        self.assertIn("can't be combined", stdout)
+        self.assertEqual(1, rc)
+
+    def test_show_summary_tail(self):
+        stdout, _stderr, _rc = call_script("show", "-m", "--tail", "1")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertIn("Tax:Refunds", lines[-1])
+        self.assertIn("-$454.21", lines[-1])
+        self.assertIn("| 32", lines[-1])
+
+    def test_show_top(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "--top", "2", "--sort", "amount"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertIn("| $1,614.00", lines[3])
+        self.assertIn("Tax:Refunds", lines[3])
+
+    def test_show_bottom(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "--bottom", "1", "--sort", "amount-"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertIn("Business Expenses:Rent", lines[-1])
+        self.assertIn("| -$3,200.00", lines[-1])
+
+    def test_show_summary_top(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "-m", "--top", "1", "--sort", "items"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertIn("Income:Consulting", lines[-1])
+        self.assertIn("| 4 ", lines[-1])
+
+    def test_show_limit_and_tail(self):
+        _stdout, stderr, rc = call_script("show", "-l", "1", "-L", "1")
+
+        self.assertIn("not allowed with argument", stderr)
+        self.assertEqual(rc, 2)
+
     def test_show_invalid_locale(self):
         os.environ["LC_ALL"] = "invalid"
         stdout, _stderr, rc = call_script("show")
@@ -541,23 +1160,95 @@ class TestCLI(unittest.TestCase):
         self.assertIn("2025-06-05", lines[3])
         self.assertIn("2025-08-18", lines[9])
 
-    def test_show_filtered_by_q3_with_regex(self):
-        stdout, _stderr, _rc = call_script("show", "2025-q3.*Income:")
+    def test_show_filtered_by_q3_with_regex(self):
+        stdout, _stderr, _rc = call_script("show", "2025-q3.*Income:")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 6)
+        self.assertIn("2025-06-05", lines[3])
+        self.assertIn("2025-07-16", lines[5])
+        self.assertNotIn("Expenses:", stdout)
+
+    def test_show_filtered_by_q4_with_hyphen_no_results(self):
+        stdout, _stderr, rc = call_script("show", "2025-q4.*Income:A-B")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(0, rc)
+
+    def test_show_filtered_by_month(self):
+        stdout, _stderr, _rc = call_script("show", "^2025-11")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 6)
+        self.assertIn("2025-11-30", lines[3])
+        self.assertIn("2025-11-30", lines[5])
+
+    def test_show_filtered_by_year_or_category(self):
+        stdout, _stderr, _rc = call_script("show", "^2024|Tax:")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 13)
+        self.assertIn("2024-01-12", lines[3])
+        self.assertIn("Tax:Refunds", lines[-1])
+
+    def test_show_filtered_by_from_to(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "--from", "2025-07", "--to", "2025-08-01"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 8)
+        self.assertIn("2025-07-06", lines[3])
+        self.assertIn("2025-08-01", lines[-1])
+
+        stdout, _stderr, _rc = call_script(
+            "show", "2025-q3.*Income:", "--to", "2025-07-10"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertIn("2025-07-06", lines[-1])
+
+    def test_show_filtered_by_from_unsorted(self):
+        first_line = '2024-01-12,"Personal Expenses:Travel",-20.01,"FreedomCard","MOBIL 7581245411",'  # noqa: E501
+        last_line = '2025-12-30,"Income:Affiliates:Amazon",234.56,"Checking","AMAZON.COM, INC. PAYMENTS",'  # noqa: E501
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        # Swap the lines.
+        lines[1] = f"{last_line}\n"
+        lines[-1] = f"{first_line}\n"
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        stdout, _stderr, _rc = call_script(
+            "show", "--from", "2025-12", "--raw"
+        )
 
-        lines = stdout.splitlines()
+        # Swap the lines back.
+        lines[1] = f"{first_line}\n"
+        lines[-1] = f"{last_line}\n"
 
-        self.assertEqual(len(lines), 6)
-        self.assertIn("2025-06-05", lines[3])
-        self.assertIn("2025-07-16", lines[5])
-        self.assertNotIn("Expenses:", stdout)
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
 
-    def test_show_filtered_by_q4_with_hyphen_no_results(self):
-        stdout, _stderr, rc = call_script("show", "2025-q4.*Income:A-B")
+        self.assertIn(last_line, stdout)
+        self.assertNotIn(first_line, stdout)
 
-        lines = stdout.splitlines()
+    def test_show_filtered_by_invalid_from(self):
+        _stdout, stderr, rc = call_script("show", "--from", "2025-7")
 
-        self.assertEqual(len(lines), 3)
-        self.assertEqual(0, rc)
+        self.assertIn("YYYY-MM-DD", stderr)
+        self.assertEqual(rc, 2)
 
     def test_show_raw(self):
         PLUTUS = load_plutus_module()
@@ -579,6 +1270,100 @@ class TestCLI(unittest.TestCase):
             stdout,
         )
 
+    def test_show_profile_cache(self):
+        PLUTUS = load_plutus_module()
+
+        if os.path.exists(TEST_PROFILE_CACHE):
+            os.remove(TEST_PROFILE_CACHE)
+
+        stdout, _stderr, _rc = call_script("show", "--summary-with-items")
+
+        self.assertEqual(
+            TEST_PROFILE_CACHE, PLUTUS.profile_cache_path(TEST_PROFILE)
+        )
+        self.assertTrue(os.path.exists(TEST_PROFILE_CACHE))
+
+        stdout_cached, _stderr, _rc = call_script(
+            "show", "--summary-with-items"
+        )
+
+        self.assertEqual(stdout, stdout_cached)
+
+    def test_show_profile_cache_mode(self):
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+
+        if os.path.exists(TEST_PROFILE_CACHE):
+            os.remove(TEST_PROFILE_CACHE)
+
+        call_script("show")
+        cache_mode = os.stat(TEST_PROFILE_CACHE).st_mode & 0o777
+
+        os.chmod(TEST_PROFILE, mode)
+
+        self.assertEqual(0o600, cache_mode)
+
+    def test_show_profile_cache_invalidated(self):
+        call_script("show")
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        # Same length as the original line so only the content changes.
+        original_line = lines[-1]
+        lines[-1] = original_line.replace("234.56", "999.99")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        stdout, _stderr, _rc = call_script("show", "--raw")
+
+        lines[-1] = original_line
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn("999.99", stdout)
+        self.assertNotIn("234.56", stdout)
+
+    def test_show_profile_cache_appended(self):
+        call_script("show")
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_PROFILE, "a") as file:
+            file.write('2026-01-01,"Income:Merch",1.00,"Checking",,\n')
+
+        stdout, _stderr, _rc = call_script("show", "2026", "--raw")
+
+        with open(TEST_PROFILE, "a") as file:
+            file.write('2026-01-02,"Income:Merch",ZZZ,"Checking",,\n')
+
+        stdout_invalid, _stderr, rc = call_script("show")
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertIn("2026-01-01", stdout)
+        self.assertIn("PARSE_FAILURE", stdout_invalid)
+        self.assertIn("L35", stdout_invalid)
+        self.assertEqual(1, rc)
+
+    def test_show_raw_filtered_by_from_to(self):
+        PLUTUS = load_plutus_module()
+
+        stdout, _stderr, _rc = call_script(
+            "show", "Income:", "--from", "2025-10", "--to", "2025-11", "--raw"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(PLUTUS.CSV_HEADERS, lines[0])
+        self.assertEqual(7, len(lines))
+        self.assertTrue(lines[1].startswith("2025-10-11"))
+        self.assertTrue(lines[-1].startswith("2025-11-30"))
+
     def test_show_sort_by_date(self):
         stdout, _stderr, _rc = call_script("show", "--sort", "date")
 
@@ -754,6 +1539,95 @@ class TestCLI(unittest.TestCase):
         self.assertIn("| 1", lines[-1])
         self.assertIn("| 32", lines[-1])
 
+    def test_show_summary_min_max_average(self):
+        stdout, _stderr, _rc = call_script("show", "--summary")
+
+        lines = stdout.splitlines()
+
+        self.assertIn("| Min", lines[1])
+        self.assertIn("| Max", lines[1])
+        self.assertIn("| Average", lines[1])
+        self.assertIn("| $236.00", lines[-1])
+        self.assertIn("| $1,614.00", lines[-1])
+        self.assertIn("| $925.00", lines[-1])
+
+    def test_show_summary_multiple_columns(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "--summary", "category,method"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 20)
+        self.assertIn("| Category", lines[1])
+        self.assertIn("| Method", lines[1])
+        self.assertIn("Tax:Refunds", lines[-1])
+        self.assertIn("| Checking", lines[-1])
+        self.assertIn("-$454.21", lines[-1])
+        self.assertIn("| 32", lines[-1])
+
+    def test_show_summary_invalid_column(self):
+        _stdout, stderr, rc = call_script("show", "--summary", "category,nope")
+
+        self.assertIn("'nope' must be", stderr)
+        self.assertEqual(rc, 2)
+
+    def test_show_tree(self):
+        stdout, _stderr, _rc = call_script("show", "--tree")
+
+        lines = stdout.splitlines()
+
+        self.assertIn("| Amount", lines[1])
+        self.assertTrue(lines[3].startswith("Business Expenses "))
+        self.assertIn("├── Hosting", stdout)
+        self.assertIn("│   └── Domain Names", stdout)
+        self.assertIn("└── Refunds", lines[-1])
+
+    def test_show_tree_depth(self):
+        stdout, _stderr, _rc = call_script("show", "--tree", "--depth", "1")
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 7)
+        self.assertNotIn("──", stdout)
+        self.assertTrue(lines[-1].startswith("Tax "))
+
+    def test_show_tree_invalid_depth(self):
+        _stdout, stderr, rc = call_script("show", "--tree", "--depth", "0")
+
+        self.assertIn("'0' must be", stderr)
+        self.assertEqual(rc, 2)
+
+    def test_show_pivot_quarter(self):
+        stdout, _stderr, _rc = call_script(
+            "show", "--pivot", "quarter", "--depth", "1"
+        )
+
+        lines = stdout.splitlines()
+
+        self.assertEqual(len(lines), 8)
+        self.assertIn("| 2025-q2", lines[1])
+        self.assertTrue(lines[1].rstrip().endswith("| Total"))
+        self.assertTrue(lines[-2].startswith("Tax "))
+        self.assertIn("| $1,850.00", lines[-2])
+        self.assertTrue(lines[-1].startswith("Total "))
+        self.assertTrue(lines[-1].rstrip().endswith("-$454.21"))
+
+    def test_show_pivot_year_filtered(self):
+        stdout, _stderr, _rc = call_script("show", "2024", "--pivot", "year")
+
+        lines = stdout.splitlines()
+
+        self.assertIn("| 2024", lines[1])
+        self.assertNotIn("2025", lines[1])
+        self.assertTrue(lines[-1].startswith("Total "))
+
+    def test_show_pivot_invalid_period(self):
+        _stdout, stderr, rc = call_script("show", "--pivot", "week")
+
+        self.assertIn("'week' must be", stderr)
+        self.assertEqual(rc, 2)
+
     def test_show_summary_sort_by_category(self):
         stdout, _stderr, _rc = call_script("show", "-m", "--sort", "category")
 
@@ -897,6 +1771,49 @@ class TestCLI(unittest.TestCase):
         self.assertEqual(lines[0].strip(), expected_headers.strip())
         self.assertEqual([lines[1].strip(), lines[-1].strip()], expected_items)
 
+    def test_edit_sort_in_runs(self):
+        PLUTUS = load_plutus_module()
+
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines[:1] + lines[:0:-1])
+
+        # Force the items to be sorted in spilled runs that get merged.
+        PLUTUS.SORT_RUN_ITEMS = 4
+
+        with contextlib.redirect_stdout(io.StringIO()) as stdout:
+            PLUTUS.sort_profile(TEST_PROFILE)
+
+        with open(TEST_PROFILE) as file:
+            sorted_lines = file.readlines()
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertEqual(lines, sorted_lines)
+        self.assertIn("items were out of order", stdout.getvalue())
+
+    def test_edit_sort_keeps_symlink_and_mode(self):
+        PLUTUS = load_plutus_module()
+
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+        os.symlink(TEST_PROFILE, TEST_PROFILE_LINK)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            PLUTUS.sort_profile(TEST_PROFILE_LINK)
+
+        is_link = os.path.islink(TEST_PROFILE_LINK)
+        sorted_mode = os.stat(TEST_PROFILE).st_mode & 0o777
+
+        os.remove(TEST_PROFILE_LINK)
+        os.chmod(TEST_PROFILE, mode)
+
+        self.assertTrue(is_link)
+        self.assertEqual(0o600, sorted_mode)
+
     def test_config_help(self):
         stdout, _stderr, _rc = call_script("config", "--help")
         self.assertIn("a number of config files", stdout)
@@ -1003,6 +1920,296 @@ class TestCLI(unittest.TestCase):
         self.assertIn(f"ibe = {SCRIPT_PATH} show", stdout)
         self.assertEqual(rc, 1)
 
+    def test_alias_many(self):
+        ibe_stdout, _stderr, _rc = call_script("alias", "ibe")
+        stdout, _stderr, rc = call_script("alias", "--many", "ibe", "ibe")
+
+        self.assertEqual(f"{ibe_stdout}{ibe_stdout}", stdout)
+        self.assertEqual(0, rc)
+
+        stdout, _stderr, rc = call_script("alias", "--many", "ibe", "nope")
+
+        self.assertIn("'nope' not found", stdout)
+        self.assertNotIn("Income:Consulting", stdout)
+        self.assertEqual(1, rc)
+
+    def test_alias_argv(self):
+        PLUTUS = load_plutus_module()
+
+        self.assertEqual(
+            ["show", "^2025.*Income:", "--tree"],
+            PLUTUS.alias_argv('plutus show "^2025.*Income:" --tree'),
+        )
+        self.assertEqual(
+            ["show", "a|b"], PLUTUS.alias_argv("src/plutus show 'a|b'")
+        )
+        self.assertIsNone(PLUTUS.alias_argv("plutus show | head"))
+        self.assertIsNone(PLUTUS.alias_argv("plutus show > /tmp/out.txt"))
+        self.assertIsNone(PLUTUS.alias_argv("plutus show $HOME"))
+        self.assertIsNone(PLUTUS.alias_argv("plutus insert"))
+        self.assertIsNone(PLUTUS.alias_argv("echo plutus show"))
+        self.assertIsNone(PLUTUS.alias_argv('plutus show "unclosed'))
+
+    def test_report(self):
+        with open(TEST_REPORT, "w") as file:
+            file.write("[Report]\n")
+            file.write('income = "^$$.*Income:" --summary category\n')
+            file.write("zelle = $$.*Zelle --sort amount\n")
+
+        stdout, _stderr, rc = call_script(
+            "report", "2025-q4", "-f", TEST_REPORT
+        )
+
+        income_stdout, _stderr, _rc = call_script(
+            "show", "^2025-q4.*Income:", "--summary", "category"
+        )
+        zelle_stdout, _stderr, _rc = call_script(
+            "show", "2025-q4.*Zelle", "--sort", "amount"
+        )
+
+        self.assertEqual(
+            f"""income: "^2025-q4.*Income:" --summary category
+
+{income_stdout}
+
+zelle: 2025-q4.*Zelle --sort amount
+
+{zelle_stdout}""",
+            stdout,
+        )
+        self.assertEqual(0, rc)
+
+    def test_report_invalid_amount(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        with open(TEST_PROFILE, "a") as file:
+            file.write('2026-01-02,"Income:Merch",ZZZ,"Checking",,\n')
+
+        with open(TEST_REPORT, "w") as file:
+            file.write("[Report]\n")
+            file.write('income = "^$$.*Income:" --summary category\n')
+
+        stdout, _stderr, rc = call_script(
+            "report", "2025-q4", "-f", TEST_REPORT
+        )
+        stdout_invalid, _stderr, rc_invalid = call_script(
+            "report", "2026", "-f", TEST_REPORT
+        )
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        self.assertNotIn("PARSE_FAILURE", stdout)
+        self.assertEqual(0, rc)
+        self.assertIn("PARSE_FAILURE", stdout_invalid)
+        self.assertEqual(1, rc_invalid)
+
+    def test_report_invalid(self):
+        with open(TEST_REPORT, "w") as file:
+            file.write("[Report]\n")
+            file.write("income = Income --nope\n")
+
+        stdout, _stderr, rc = call_script("report", "-f", TEST_REPORT)
+
+        self.assertIn("'income' isn't a valid query", stdout)
+        self.assertEqual(1, rc)
+
+        stdout, _stderr, rc = call_script("report")
+
+        self.assertIn("has no queries in a [Report] section", stdout)
+        self.assertEqual(1, rc)
+
+    def split_test_profile(self):
+        shutil.rmtree(TEST_PROFILE_SHARDS, ignore_errors=True)
+
+        return call_script("shard", "--split", TEST_PROFILE_SHARDS)
+
+    def test_shard_help(self):
+        stdout, _stderr, _rc = call_script("shard", "--help")
+        self.assertIn("1 file per year", stdout)
+
+    def test_shard_split_and_join(self):
+        stdout, _stderr, rc = self.split_test_profile()
+
+        self.assertIn("32 items were split into 2 shards", stdout)
+        self.assertTrue(os.path.exists(f"{TEST_PROFILE_SHARDS}/2024.csv"))
+        self.assertTrue(os.path.exists(f"{TEST_PROFILE_SHARDS}/2025.csv"))
+        self.assertEqual(rc, 0)
+
+        with contextlib.suppress(OSError):
+            os.remove(TEST_PROFILE_JOINED)
+
+        os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+        stdout, _stderr, rc = call_script(
+            "shard", "--join", TEST_PROFILE_JOINED
+        )
+
+        self.assertIn("32 items were joined", stdout)
+        self.assertEqual(rc, 0)
+
+        with (
+            open(TEST_PROFILE) as original,
+            open(TEST_PROFILE_JOINED) as joined,
+        ):
+            lines = [line for line in original if line.strip()]
+            self.assertEqual(lines, joined.readlines())
+
+    def test_shard_mode(self):
+        mode = os.stat(TEST_PROFILE).st_mode
+        os.chmod(TEST_PROFILE, 0o600)
+
+        self.split_test_profile()
+        split_mode = os.stat(f"{TEST_PROFILE_SHARDS}/2024.csv").st_mode & 0o777
+
+        os.chmod(TEST_PROFILE, mode)
+
+        # A new year's shard should match the existing shards.
+        with open(TEST_BATCH, "w") as file:
+            file.write("2026-01-01,Income:Merch,1500,Checking,,\n")
+
+        os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+        _stdout, _stderr, rc = call_script("insert", "--batch", TEST_BATCH)
+        insert_mode = os.stat(f"{TEST_PROFILE_SHARDS}/2026.csv").st_mode
+
+        self.assertEqual(0o600, split_mode)
+        self.assertEqual(0o600, insert_mode & 0o777)
+        self.assertEqual(0, rc)
+
+    def test_shard_invalid(self):
+        self.split_test_profile()
+
+        stdout, _stderr, rc = call_script("shard", "--join", "/tmp/nope.csv")
+        self.assertIn("PROFILE_NOT_SHARDED", stdout)
+        self.assertEqual(rc, 1)
+
+        stdout, _stderr, rc = call_script(
+            "shard", "--split", TEST_PROFILE_SHARDS
+        )
+        self.assertIn("SHARDS_ALREADY_EXIST", stdout)
+        self.assertEqual(rc, 1)
+
+        os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+        stdout, _stderr, rc = call_script("shard", "--split", "/tmp/nope")
+        self.assertIn("PROFILE_ALREADY_SHARDED", stdout)
+        self.assertEqual(rc, 1)
+
+    def test_show_sharded(self):
+        self.split_test_profile()
+
+        for args in (["-m"], ["2025", "--tree"], ["--raw", "2024-0"]):
+            expected, _stderr, _rc = call_script("show", *args)
+
+            os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+            stdout, _stderr, rc = call_script("show", *args)
+            os.environ["PLUTUS_PROFILE"] = TEST_PROFILE
+
+            self.assertEqual(expected, stdout)
+            self.assertEqual(rc, 0)
+
+    def test_lint_sharded(self):
+        self.split_test_profile()
+        os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+
+        _stdout, _stderr, rc = call_script("lint")
+        self.assertEqual(rc, 0)
+
+        with open(f"{TEST_PROFILE_SHARDS}/2024.csv", "a") as file:
+            file.write('2025-01-01,"Tax:Refunds",1.00,"Checking","",\n')
+
+        stdout, _stderr, rc = call_script("lint")
+        self.assertIn("SHARD_YEAR_MISMATCH", stdout)
+        self.assertIn("2024.csv L", stdout)
+        self.assertEqual(rc, 1)
+
+    def lint_in_process(self, profile, workers):
+        PLUTUS = load_plutus_module()
+        PLUTUS.config.read(TEST_CONFIG)
+        PLUTUS.PLUTUS_PROFILE = profile
+        PLUTUS.LINT_CHUNK_MIN_ITEMS = 1
+
+        # Cached lines are skipped which would leave nothing for the workers.
+        for path in PLUTUS.profile_paths(profile):
+            with contextlib.suppress(OSError):
+                os.remove(PLUTUS.profile_cache_path(path, "lint"))
+
+        with mock.patch("os.cpu_count", return_value=workers):
+            return PLUTUS.run_captured(["lint"])
+
+    def test_lint_parallel(self):
+        with open(TEST_PROFILE) as file:
+            lines = file.readlines()
+
+        bad_lines = list(lines)
+        bad_lines[3] = '2024-01-12,"A",0.01," ",,\n'
+        bad_lines[-2] = '2025-12-01,"Income:A",-1.00,"B",C,\n'
+
+        # The 2nd one is malformed so linting stops at that line.
+        malformed_lines = list(bad_lines)
+        malformed_lines[-3] = '2025-11-30,""A",0.01,"B",,\n'
+
+        self.split_test_profile()
+
+        with open(f"{TEST_PROFILE_SHARDS}/2025.csv", "a") as file:
+            file.write('2024-01-01,"Tax:Refunds",1.00,"Checking","",\n')
+
+        results = []
+
+        for profile_lines in (bad_lines, malformed_lines, None):
+            profile = TEST_PROFILE
+
+            if profile_lines is None:
+                profile = TEST_PROFILE_SHARDS
+            else:
+                with open(TEST_PROFILE, "w") as file:
+                    file.writelines(profile_lines)
+
+            results.append(
+                (
+                    self.lint_in_process(profile, 1),
+                    self.lint_in_process(profile, 4),
+                )
+            )
+
+        with open(TEST_PROFILE, "w") as file:
+            file.writelines(lines)
+
+        for serial, parallel in results:
+            self.assertEqual(serial, parallel)
+            self.assertEqual(1, parallel[0])
+
+        bad, malformed, sharded = [parallel for _serial, parallel in results]
+
+        self.assertIn("WHITESPACE_MISMATCH", bad[1])
+        self.assertIn("DESCRIPTION_MISMATCH", bad[1])
+        self.assertIn("FIELDS_COUNT_MISMATCH", malformed[1])
+        self.assertNotIn("DESCRIPTION_MISMATCH", malformed[1])
+        self.assertIn("2025.csv L", sharded[1])
+        self.assertIn("SHARD_YEAR_MISMATCH", sharded[1])
+
+    def test_edit_sharded(self):
+        self.split_test_profile()
+        os.environ["PLUTUS_PROFILE"] = TEST_PROFILE_SHARDS
+
+        def read_shards():
+            shards = {}
+
+            for year in ("2024", "2025"):
+                with open(f"{TEST_PROFILE_SHARDS}/{year}.csv") as file:
+                    shards[year] = file.read()
+
+            return shards
+
+        shards = read_shards()
+
+        stdout, _stderr, rc = call_script("edit")
+        self.assertIn("2024-", stdout)
+        self.assertIn("2025-", stdout)
+        self.assertEqual(rc, 0)
+
+        # Editing every shard as 1 file and splitting it back is lossless.
+        self.assertEqual(shards, read_shards())
+
     def test_version_help(self):
         stdout, _stderr, _rc = call_script("version", "--help")
         self.assertIn("Show this tool's version", stdout)
@@ -1017,6 +2224,19 @@ class TestCLI(unittest.TestCase):
         self.assertIn(".", stdout)
         self.assertEqual(rc, 0)
 
+    def test_timings(self):
+        os.environ["PLUTUS_TIMINGS"] = "1"
+        stdout, stderr, rc = call_script("show", "--summary")
+        del os.environ["PLUTUS_TIMINGS"]
+
+        self.assertIn("Tax:Refunds", stdout)
+        self.assertIn("arguments: ", stderr)
+        self.assertIn("read: ", stderr)
+        self.assertIn("filter: ", stderr)
+        self.assertIn("command (show): ", stderr)
+        self.assertIn("total: ", stderr)
+        self.assertEqual(rc, 0)
+
     def test_plutus_with_no_args(self):
         stdout, _stderr, rc = call_script()
         self.assertIn("help", stdout)